@@ -135,7 +135,11 @@ def chdir(path: Optional[Path]) -> Iterator[None]:
 
 
 def is_openapi(text: str) -> bool:
-    return 'openapi' in load_yaml(text)
+    return _is_openapi(load_yaml(text))
+
+
+def _is_openapi(data: Any) -> bool:
+    return 'openapi' in data
 
 
 JSON_SCHEMA_URLS: Tuple[str, ...] = (
@@ -145,7 +149,10 @@ JSON_SCHEMA_URLS: Tuple[str, ...] = (
 
 
 def is_schema(text: str) -> bool:
-    data = load_yaml(text)
+    return _is_schema(load_yaml(text))
+
+
+def _is_schema(data: Any) -> bool:
     if not isinstance(data, dict):
         return False
     schema = data.get('$schema')
@@ -522,9 +529,10 @@ def generate(
 
 
 def infer_input_type(text: str) -> InputFileType:
-    if is_openapi(text):
+    data = load_yaml(text)
+    if _is_openapi(data):
         return InputFileType.OpenAPI
-    elif is_schema(text):
+    elif _is_schema(data):
         return InputFileType.JsonSchema
     return InputFileType.Json
 
@@ -225,10 +225,15 @@ class DataModelFieldBase(_BaseModel):
         return True
 
 
+@lru_cache()
+def get_environment(template_dir: Path) -> Environment:
+    # one environment per directory, so included templates are compiled only once
+    return Environment(loader=FileSystemLoader(str(template_dir)))
+
+
 @lru_cache()
 def get_template(template_file_path: Path) -> Template:
-    loader = FileSystemLoader(str(TEMPLATE_DIR / template_file_path.parent))
-    environment: Environment = Environment(loader=loader)
+    environment = get_environment(TEMPLATE_DIR / template_file_path.parent)
     return environment.get_template(template_file_path.name)
 
 
@@ -3,12 +3,14 @@ import sys
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
 from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -48,7 +50,7 @@ from datamodel_code_generator.model.enum import Enum, Member
 from datamodel_code_generator.parser import DefaultPutDict, LiteralType
 from datamodel_code_generator.reference import ModelResolver, Reference
 from datamodel_code_generator.types import DataType, DataTypeManager, StrictTypes
-from datamodel_code_generator.util import Protocol, runtime_checkable
+from datamodel_code_generator.util import Protocol, cached_property, runtime_checkable
 
 SPECIAL_PATH_FORMAT: str = '#-datamodel-code-generator-#-{}-#-special-#'
 
@@ -106,6 +108,13 @@ SortedDataModels = Dict[str, DataModel]
 MAX_RECURSION_COUNT: int = sys.getrecursionlimit()
 
 
+def _get_unresolved_reference_classes(
+    path: str, reference_classes: FrozenSet[str], sorted_data_models: SortedDataModels
+) -> Set[str]:
+    # look each reference up in the sorted models instead of copying all their keys
+    return {r for r in reference_classes if r != path and r not in sorted_data_models}
+
+
 def sort_data_models(
     unsorted_data_models: List[DataModel],
     sorted_data_models: Optional[SortedDataModels] = None,
@@ -120,18 +129,19 @@ def sort_data_models(
 
     unresolved_references: List[DataModel] = []
     for model in unsorted_data_models:
-        if not model.reference_classes:
+        reference_classes = model.reference_classes
+        if not reference_classes:
             sorted_data_models[model.path] = model
         elif (
-            model.path in model.reference_classes and len(model.reference_classes) == 1
+            model.path in reference_classes and len(reference_classes) == 1
         ):  # only self-referencing
             sorted_data_models[model.path] = model
             require_update_action_models.append(model.path)
-        elif (
-            not model.reference_classes - {model.path} - set(sorted_data_models)
+        elif not _get_unresolved_reference_classes(
+            model.path, reference_classes, sorted_data_models
         ):  # reference classes have been resolved
             sorted_data_models[model.path] = model
-            if model.path in model.reference_classes:
+            if model.path in reference_classes:
                 require_update_action_models.append(model.path)
         else:
             unresolved_references.append(model)
@@ -182,8 +192,8 @@ def sort_data_models(
         # circular reference
         unsorted_data_model_names = set(unresolved_reference_model_names)
         for model in unresolved_references:
-            unresolved_model = (
-                model.reference_classes - {model.path} - set(sorted_data_models)
+            unresolved_model = _get_unresolved_reference_classes(
+                model.path, model.reference_classes, sorted_data_models
             )
             base_models = [
                 getattr(s.reference, 'path', None) for s in model.base_classes
@@ -515,20 +525,30 @@ class Parser(ABC):
         self.custom_formatter = custom_formatters
         self.custom_formatters_kwargs = custom_formatters_kwargs
 
+    @cached_property
+    def _local_sources(self) -> List[Source]:
+        # walk and read local files only once; `iter_source` is consumed several times
+        if isinstance(self.source, Path):  # pragma: no cover
+            if self.source.is_dir():
+                return [
+                    Source.from_path(path, self.base_path, self.encoding)
+                    for path in sorted(self.source.rglob('*'), key=lambda p: p.name)
+                    if path.is_file()
+                ]
+            return [Source.from_path(self.source, self.base_path, self.encoding)]
+        elif isinstance(self.source, list):  # pragma: no cover
+            return [
+                Source.from_path(path, self.base_path, self.encoding)
+                for path in self.source
+            ]
+        return []
+
     @property
     def iter_source(self) -> Iterator[Source]:
         if isinstance(self.source, str):
             yield Source(path=Path(), text=self.source)
-        elif isinstance(self.source, Path):  # pragma: no cover
-            if self.source.is_dir():
-                for path in sorted(self.source.rglob('*'), key=lambda p: p.name):
-                    if path.is_file():
-                        yield Source.from_path(path, self.base_path, self.encoding)
-            else:
-                yield Source.from_path(self.source, self.base_path, self.encoding)
-        elif isinstance(self.source, list):  # pragma: no cover
-            for path in self.source:
-                yield Source.from_path(path, self.base_path, self.encoding)
+        elif isinstance(self.source, (Path, list)):
+            yield from self._local_sources
         else:
             yield Source(
                 path=Path(self.source.path),
@@ -876,7 +896,7 @@ class Parser(ABC):
                         )
 
     def __reuse_model(
-        self, models: List[DataModel], require_update_action_models: List[str]
+        self, models: List[DataModel], require_update_action_models: Set[str]
     ) -> None:
         if not self.reuse_model:
             return None
@@ -908,7 +928,7 @@ class Parser(ABC):
                         ),
                     )
                     if cached_model_reference.path in require_update_action_models:
-                        require_update_action_models.append(inherited_model.path)
+                        require_update_action_models.add(inherited_model.path)
                     models.insert(index, inherited_model)
                     models.remove(model)
 
@@ -1187,16 +1207,21 @@ class Parser(ABC):
         _, sorted_data_models, require_update_action_models = sort_data_models(
             self.results
         )
+        # checked once per model while dumping, so keep the paths in a set
+        require_update_action_model_paths: Set[str] = set(require_update_action_models)
 
         results: Dict[Tuple[str, ...], Result] = {}
 
-        def module_key(data_model: DataModel) -> Tuple[str, ...]:
-            return tuple(data_model.module_path)
+        # resolve each model's module path once for both sorting and grouping
+        keyed_models = [
+            (tuple(data_model.module_path), data_model)
+            for data_model in sorted_data_models.values()
+        ]
 
         # process in reverse order to correctly establish module levels
         grouped_models = groupby(
-            sorted(sorted_data_models.values(), key=module_key, reverse=True),
-            key=module_key,
+            sorted(keyed_models, key=itemgetter(0), reverse=True),
+            key=itemgetter(0),
         )
 
         module_models: List[Tuple[Tuple[str, ...], List[DataModel]]] = []
@@ -1207,7 +1232,7 @@ class Parser(ABC):
         module_to_import: Dict[Tuple[str, ...], Imports] = {}
 
         previous_module = ()  # type: Tuple[str, ...]
-        for module, models in ((k, [*v]) for k, v in grouped_models):  # type: Tuple[str, ...], List[DataModel]
+        for module, models in ((k, [m for _, m in v]) for k, v in grouped_models):  # type: Tuple[str, ...], List[DataModel]
             for model in models:
                 model_to_module_models[model] = module, models
             self.__delete_duplicate_models(models)
@@ -1259,7 +1284,7 @@ class Parser(ABC):
             self.__change_from_import(models, imports, scoped_model_resolver, init)
             self.__extract_inherited_enum(models)
             self.__set_reference_default_value_to_field(models)
-            self.__reuse_model(models, require_update_action_models)
+            self.__reuse_model(models, require_update_action_model_paths)
             self.__collapse_root_models(models, unused_models, imports)
             self.__set_default_enum_member(models)
             self.__sort_models(models, imports)
@@ -1295,7 +1320,7 @@ class Parser(ABC):
                     self.dump_resolve_reference_action(
                         m.reference.short_name
                         for m in models
-                        if m.path in require_update_action_models
+                        if m.path in require_update_action_model_paths
                     ),
                 ]
 
@@ -8,6 +8,7 @@ from datamodel_code_generator.model.base import (
     DataModel,
     DataModelFieldBase,
     TemplateBase,
+    get_template,
 )
 from datamodel_code_generator.reference import Reference
 from datamodel_code_generator.types import DataType, Types
@@ -290,3 +291,10 @@ def test_data_field():
         name='a', data_type=DataType(is_list=True), required=False
     )
     assert field.type_hint == 'Optional[List]'
+
+
+def test_get_template_shares_environment_per_directory():
+    base_model = get_template(Path('pydantic/BaseModel.jinja2'))
+    root_model = get_template(Path('pydantic/BaseModel_root.jinja2'))
+    assert base_model.environment is root_model.environment
+    assert get_template(Path('Enum.jinja2')).environment is not base_model.environment
@@ -11,7 +11,7 @@ import yaml
 
 from datamodel_code_generator.imports import Import
 from datamodel_code_generator.model import DataModelFieldBase
-from datamodel_code_generator.parser.base import dump_templates
+from datamodel_code_generator.parser.base import Source, dump_templates
 from datamodel_code_generator.parser.jsonschema import (
     JsonSchemaObject,
     JsonSchemaParser,
@@ -548,3 +548,19 @@ def test_json_schema_parser_extension(source_obj, generated_classes):
     )
     parser.parse_object('Person', AltJsonSchemaObject.parse_obj(source_obj), [])
     assert dump_templates(list(parser.results)) == generated_classes
+
+
+def test_json_schema_parser_iter_source_reads_files_once(mocker):
+    source = DATA_PATH / 'multiple_files'
+    parser = JsonSchemaParser(source=source, base_path=source)
+    from_path = mocker.spy(Source, 'from_path')
+    first = list(parser.iter_source)
+    second = list(parser.iter_source)
+    assert [s.path for s in first] == [
+        Path('file_a.json'),
+        Path('file_b.json'),
+        Path('file_c.json'),
+        Path('file_d.json'),
+    ]
+    assert first == second
+    assert from_path.call_count == 4
@@ -47,3 +47,11 @@ def test_infer_input_type():
             assert_infer_input_type(file, InputFileType.Json)
             continue
         assert_infer_input_type(file, InputFileType.OpenAPI)
+
+
+def test_infer_input_type_loads_text_once(mocker):
+    load_yaml = mocker.patch(
+        'datamodel_code_generator.load_yaml', return_value={'type': 'object'}
+    )
+    assert infer_input_type('{"type": "object"}') == InputFileType.JsonSchema
+    load_yaml.assert_called_once_with('{"type": "object"}')